@@ -41,6 +41,7 @@ DEFAULT_PORT = 8001
 ENV_PORT = "SPYONCINO_DISCOVERY_PORT"
 
 _SENT = object()
+_PACKAGE_DIR = Path(__file__).resolve().parent
 
 
 def _next_event(it: Iterator[dict[str, object]]) -> object:
@@ -51,11 +52,11 @@ def _next_event(it: Iterator[dict[str, object]]) -> object:
 
 
 def _discover_template_path() -> Path:
-    return Path(__file__).resolve().parent / "templates" / "discover.html"
+    return _PACKAGE_DIR / "templates" / "discover.html"
 
 
 def _brand_static_dir() -> Path | None:
-    bundled = Path(__file__).resolve().parent / "static"
+    bundled = _PACKAGE_DIR / "static"
     if (bundled / "logo.ico").is_file():
         return bundled
     return None
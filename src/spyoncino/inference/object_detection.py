@@ -1,7 +1,9 @@
 import logging
+import os
+import re
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 import cv2
 import numpy as np
@@ -135,6 +137,47 @@ def ensure_detector_weights_file(weights: str) -> str:
     return str(out_path)
 
 
+def _tensorrt_engine_path(weights: Path, batch: int, half: bool, imgsz: int) -> Path:
+    """Cached engine path next to the ``.pt``, keyed by GPU model, batch, precision and size."""
+    gpu = (
+        re.sub(r"[^a-zA-Z0-9]+", "-", torch.cuda.get_device_name(0)).strip("-").lower()
+    )
+    precision = "fp16" if half else "fp32"
+    return weights.with_name(
+        f"{weights.stem}.{gpu}.b{batch}.{precision}.{imgsz}.engine"
+    )
+
+
+def build_tensorrt_engine(
+    weights: str, batch: int, half: bool = True, imgsz: int = 640
+) -> str:
+    """
+    Export ``weights`` to a TensorRT engine (dynamic batch up to ``batch``) or reuse the
+    cached one. Requires CUDA and the ``tensorrt`` package; raises on failure.
+    """
+    pt_path = Path(weights).resolve()
+    engine_path = _tensorrt_engine_path(pt_path, batch, half, imgsz)
+    if engine_path.is_file() and engine_path.stat().st_mtime >= pt_path.stat().st_mtime:
+        return str(engine_path)
+    _log.info(
+        "Building TensorRT engine (batch<=%s, %s) — one-time, may take minutes: %s",
+        batch,
+        "fp16" if half else "fp32",
+        engine_path,
+    )
+    exported = YOLO(str(pt_path)).export(
+        format="engine",
+        half=half,
+        device=0,
+        batch=batch,
+        imgsz=imgsz,
+        dynamic=True,
+        verbose=False,
+    )
+    Path(exported).replace(engine_path)
+    return str(engine_path)
+
+
 def _draw_label_pill(
     overlay: np.ndarray,
     x1: int,
@@ -181,23 +224,57 @@ class ObjectDetection:
         conf_threshold: float = 0.25,
         iou_threshold: float = 0.6,
         batch_size: int = 16,
-        alarmed_classes: list = ["person"],
+        alarmed_classes: Iterable[str] = ("person",),
+        tensorrt: bool = False,
+        half: Optional[bool] = None,
+        imgsz: int = 640,
     ):
         self.weights = weights
         self.conf_threshold = conf_threshold
         self.iou_threshold = iou_threshold
         self.batch_size = batch_size
-        self.alarmed_classes = alarmed_classes
+        # Network input size (long side, multiple of 32); cost scales with its square.
+        self.imgsz = int(imgsz)
+        # Membership-tested for every box; a bare string from YAML means one class.
+        if isinstance(alarmed_classes, str):
+            alarmed_classes = (alarmed_classes,)
+        self.alarmed_classes = frozenset(alarmed_classes)
+        # Detection batches vary in size (tail batches are shorter); expandable segments
+        # let the CUDA caching allocator grow in place instead of fragmenting. PyTorch reads
+        # this when CUDA initializes, not at import, so it must be set before the first CUDA
+        # call below (a process that already touched CUDA keeps its allocator settings).
+        # An explicit user value wins; not supported on Windows.
+        if os.name != "nt":
+            os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # FP16 inference: default on for CUDA, never on CPU (unsupported / slower there).
+        self.half = (self.device == "cuda") if half is None else bool(half)
+        if self.half and self.device != "cuda":
+            _log.warning("half: true ignored — CUDA not available")
+            self.half = False
         if weights:
             resolved = ensure_detector_weights_file(weights)
             self.weights = resolved
             _patch_attempt_download_for_existing_files()
-            self.model = YOLO(resolved)
+            self.model = self._load_model(resolved, tensorrt)
         else:
             self.weights = weights
             self.model = YOLO(weights)
 
+    def _load_model(self, weights: str, tensorrt: bool) -> YOLO:
+        """YOLO from ``.pt``, or its cached TensorRT engine when requested on CUDA."""
+        if tensorrt and self.device == "cuda":
+            try:
+                engine = build_tensorrt_engine(
+                    weights, int(self.batch_size), half=self.half, imgsz=self.imgsz
+                )
+                return YOLO(engine, task="detect")
+            except Exception as e:
+                _log.warning("TensorRT engine unavailable (%s); using %s", e, weights)
+        elif tensorrt:
+            _log.warning("tensorrt: true ignored — CUDA not available")
+        return YOLO(weights)
+
     def detect(self, frames: List[np.ndarray]):
         """
         Run YOLO on ``frames``. Returns one dict per frame (aligned with input order),
@@ -206,26 +283,32 @@ class ObjectDetection:
         """
         frames_with_labels: list = []
         alarmed = False
+        name_map = None
         for i in range(0, len(frames), self.batch_size):
             batch = frames[i : i + self.batch_size]
             results = self.model.predict(
                 batch,
                 conf=self.conf_threshold,
                 iou=self.iou_threshold,
+                half=self.half,
+                device=self.device,
+                imgsz=self.imgsz,
                 verbose=False,
                 batch=len(batch),
             )
+            if name_map is None:
+                # ``model.names`` re-validates the class map on every access; read it once,
+                # after predict() so engine backends already have their predictor set up.
+                name_map = self.model.names
             for j, result in enumerate(results):
                 frame = batch[j]
-                h, w = frame.shape[:2]
-                empty_overlay = np.zeros((h, w, 3), dtype=np.uint8)
                 frame_index = i + j
-                name_map = self.model.names
-                if result.boxes is None or len(result.boxes) == 0:
+                det_boxes = result.boxes
+                if det_boxes is None or len(det_boxes) == 0:
                     frames_with_labels.append(
                         {
                             "frame_index": frame_index,
-                            "overlay": empty_overlay,
+                            "overlay": np.zeros((*frame.shape[:2], 3), dtype=np.uint8),
                             "boxes": np.empty((0, 4), dtype=np.float32),
                             "confidences": np.array([], dtype=np.float32),
                             "labels": [],
@@ -233,9 +316,11 @@ class ObjectDetection:
                         }
                     )
                     continue
-                boxes = result.boxes.xyxy.cpu().numpy()
-                confidences = result.boxes.conf.cpu().numpy()
-                classes = result.boxes.cls.cpu().numpy()
+                # One device->host copy per frame; columns are xyxy, [track id,] conf, cls.
+                data = det_boxes.data.cpu().numpy()
+                boxes = data[:, :4]
+                confidences = data[:, -2]
+                classes = data[:, -1]
                 labels = [name_map[int(cls_id)] for cls_id in classes]
                 is_alarmed = [label in self.alarmed_classes for label in labels]
                 alarmed = alarmed or any(is_alarmed)
@@ -269,12 +354,16 @@ class ObjectDetection:
 
         color_normal = (100, 220, 100)
         color_alarmed = (60, 80, 255)
-        for box, confidence, label, alarmed in zip(
-            boxes, confidences, labels, is_alarmed
+        # Round and clip all boxes in one NumPy pass (np.rint rounds half-to-even like round()).
+        ib = np.rint(np.asarray(boxes, dtype=np.float64).reshape(-1, 4)).astype(
+            np.int64
+        )
+        np.maximum(ib[:, :2], 0, out=ib[:, :2])
+        np.minimum(ib[:, 2], w - 1, out=ib[:, 2])
+        np.minimum(ib[:, 3], h - 1, out=ib[:, 3])
+        for (x1, y1, x2, y2), confidence, label, alarmed in zip(
+            ib.tolist(), confidences, labels, is_alarmed
         ):
-            x1, y1, x2, y2 = [int(round(v)) for v in box]
-            x1, y1 = max(0, x1), max(0, y1)
-            x2, y2 = min(w - 1, x2), min(h - 1, y2)
             if x2 <= x1 or y2 <= y1:
                 continue
 
@@ -8,9 +8,11 @@ _logger = logging.getLogger(__name__)
 
 
 def _trim_buffer(rolling_buffer, maxlen):
+    # One slice delete: each proxy call is a Manager round-trip, so avoid pop(0) loops.
     try:
-        while len(rolling_buffer) > maxlen:
-            rolling_buffer.pop(0)
+        excess = len(rolling_buffer) - max(0, maxlen)
+        if excess > 0:
+            del rolling_buffer[:excess]
     except (IndexError, TypeError):
         pass
 
@@ -144,6 +146,14 @@ class CamGrabber:
         except Exception:
             _logger.debug("CamGrabber _stop cleanup failed", exc_info=True)
 
+    def start(self):
+        """Start the grab process again after :meth:`stop`. No-op while running."""
+        self._start()
+
+    def stop(self):
+        """Stop the grab process (joins with a short timeout). Safe to call repeatedly."""
+        self._stop()
+
     def snap(self):
         """
         Get the latest frame from the buffer.
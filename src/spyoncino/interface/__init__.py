@@ -16,7 +16,6 @@ from .memory_manager import (
     ServiceStatus,
     SystemMetrics,
 )
-from .telegram_bot import TelegramBotInterface, NotificationEvent
 
 __all__ = [
     "MemoryManager",
@@ -31,6 +30,11 @@ __all__ = [
 
 
 def __getattr__(name: str):
+    # Lazy: telegram_bot pulls in cv2 / Pillow / python-telegram-bot.
+    if name in ("TelegramBotInterface", "NotificationEvent"):
+        from . import telegram_bot
+
+        return getattr(telegram_bot, name)
     if name == "WebAppInterface":
         from .webapp import WebAppInterface
 
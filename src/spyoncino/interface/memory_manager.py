@@ -15,7 +15,7 @@ import shutil
 import uuid
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -505,22 +505,36 @@ class MemoryManager:
             last_error: Optional error message
             uptime_seconds: Optional uptime in seconds
         """
+        self.update_services_status(
+            [(service_name, is_running, last_error, uptime_seconds)]
+        )
+
+    def update_services_status(
+        self,
+        statuses: Iterable[Tuple[str, bool, Optional[str], Optional[float]]],
+    ) -> None:
+        """
+        Update several service rows in one transaction (one commit per patrol cycle).
+
+        Args:
+            statuses: ``(service_name, is_running, last_error, uptime_seconds)`` tuples
+        """
+        now = datetime.now()
+        rows = [
+            (name, is_running, now, last_error, uptime_seconds, now)
+            for name, is_running, last_error, uptime_seconds in statuses
+        ]
+        if not rows:
+            return
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT OR REPLACE INTO services
                     (service_name, is_running, last_check, last_error, uptime_seconds, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        service_name,
-                        is_running,
-                        datetime.now(),
-                        last_error,
-                        uptime_seconds,
-                        datetime.now(),
-                    ),
+                    rows,
                 )
                 conn.commit()
 
@@ -8,6 +8,7 @@ Sends images/videos with overlays when events are detected.
 import asyncio
 import html
 import io
+import os
 import queue
 import time
 from contextlib import suppress
@@ -15,10 +16,10 @@ from collections import deque
 import logging
 import re
 from types import SimpleNamespace
-from functools import wraps
+from functools import lru_cache, wraps
 import cv2
-import imageio
 import numpy as np
+from PIL import Image
 import yaml
 from pathlib import Path
 from datetime import datetime, timezone
@@ -35,10 +36,20 @@ from .authz import Principal, auth_state_from_config, can
 from .memory_manager import MemoryManager, EventType
 
 from ..recipe_classes import normalize_notify_modes
+from ..yaml_io import safe_load as yaml_safe_load
+
+_logger = logging.getLogger(__name__)
 
 # Media list callback payload meaning "no camera/stage filter" (must match keyboard rows).
 _MEDIA_LIST_ALL = "".join(chr(c) for c in (97, 108, 108))
 
+# Environment variables that override ``secrets.yaml`` values: var -> (section, key, cast).
+_ENV_SECRET_MAP: Dict[str, Tuple[str, str, Any]] = {
+    "TELEGRAM_BOT_TOKEN": ("telegram", "token", str),
+    "TELEGRAM_CHAT_ID": ("telegram", "chat_id", int),
+    "SECURITY_SETUP_PASSWORD": ("authentication", "setup_password", str),
+}
+
 # Outbound queue: alerts wait when Telegram rate limit is active (no drop-on-enqueue).
 _NOTIFICATION_QUEUE_MAX = 512
 # Max items pulled from the queue in one drain pass (then text-merge + per-GIF sends).
@@ -48,6 +59,8 @@ _EMERGENCY_RECAP_THRESHOLD = 32
 # Batch strategy: if pending ≥ this, send digest chunk(s) instead of per-alert GIF until caught up.
 _BATCH_DIGEST_THRESHOLD = 10
 _BATCH_DIGEST_CHUNK = 15
+# GIF/video frames wider than this are downscaled before encoding.
+_NOTIFY_MAX_WIDTH = 1280
 
 # SQLite ``config`` keys documented for Telegram; orchestrator/bot read these when set.
 _SQLITE_CONFIG_KNOBS: Tuple[Tuple[str, str, str], ...] = (
@@ -127,6 +140,76 @@ def _require_superuser(func):
     )(func)
 
 
+def _env_secret_snapshot(environ: Optional[Any] = None) -> Dict[str, str]:
+    """Non-empty :data:`_ENV_SECRET_MAP` variables, read from the environment in one pass."""
+    env = os.environ if environ is None else environ
+    return {var: raw for var in _ENV_SECRET_MAP if (raw := env.get(var))}
+
+
+def _secrets_with_env_overrides(
+    secrets: Dict[str, Any], env: Dict[str, str]
+) -> Dict[str, Any]:
+    """
+    Return a copy of ``secrets`` with :data:`_ENV_SECRET_MAP` variables from ``env`` applied
+    (env wins); unset or empty variables leave the file value.
+    """
+    merged = {k: dict(v) if isinstance(v, dict) else v for k, v in secrets.items()}
+    for var, (section, key, cast) in _ENV_SECRET_MAP.items():
+        raw = env.get(var)
+        if not raw:
+            continue
+        try:
+            value = cast(raw.strip())
+        except ValueError:
+            _logger.warning("Ignoring invalid %s", var)
+            continue
+        target = merged.get(section)
+        if not isinstance(target, dict):
+            target = merged[section] = {}
+        target[key] = value
+    return merged
+
+
+@lru_cache(maxsize=32)
+def _sample_indices(n: int, max_frames: int) -> Tuple[int, ...]:
+    """Evenly spaced indices picking at most ``max_frames`` of ``n`` frames (all if they fit)."""
+    if n <= max_frames:
+        return tuple(range(n))
+    step = n / max_frames
+    return tuple(int(i * step) for i in range(max_frames))
+
+
+@lru_cache(maxsize=8)
+def _notification_frame_size(w: int, h: int) -> Optional[Tuple[int, int]]:
+    """Encoder ``(width, height)`` for a ``w``x``h`` frame, or None if it fits as-is."""
+    if w <= _NOTIFY_MAX_WIDTH:
+        return None
+    scale = _NOTIFY_MAX_WIDTH / w
+    return int(w * scale), int(h * scale)
+
+
+def _fit_notification_width(frame: np.ndarray) -> np.ndarray:
+    """
+    Downscale ``frame`` to :data:`_NOTIFY_MAX_WIDTH` if wider. Bilinear is enough down to
+    half size; beyond that it skips source pixels (aliasing), so use area averaging.
+    """
+    h, w = frame.shape[:2]
+    size = _notification_frame_size(w, h)
+    if size is None:
+        return frame
+    interp = cv2.INTER_LINEAR if size[0] * 2 >= w else cv2.INTER_AREA
+    return cv2.resize(frame, size, interpolation=interp)
+
+
+def _paste_overlay(frame: np.ndarray, overlay: np.ndarray) -> None:
+    """
+    Paste the non-black pixels of a same-size 3-channel ``overlay`` onto ``frame`` in place.
+    OpenCV mask ops avoid the full-frame uint64 ``sum(axis=2)`` pass.
+    """
+    b, g, r = cv2.split(overlay)
+    cv2.copyTo(overlay, cv2.bitwise_or(cv2.bitwise_or(b, g), r), frame)
+
+
 @dataclass
 class NotificationEvent:
     """Represents a notification event."""
@@ -179,16 +262,24 @@ class TelegramBotInterface:
             config: Configuration dictionary from recipe
             media_store: Optional MediaStore for persisted recordings (path + DB index)
         """
-        # Load secrets from YAML file
+        # Load secrets from YAML file (env overrides snapshotted once)
+        env_secrets = _env_secret_snapshot()
+        self._env_secret_vars = frozenset(env_secrets)
         secrets_file = Path(secrets_path)
-        if not secrets_file.exists():
-            raise FileNotFoundError(f"Secrets file not found: {secrets_path}")
-
-        with open(secrets_file, "r") as f:
-            secrets = yaml.safe_load(f)
-        secrets = secrets if isinstance(secrets, dict) else {}
+        try:
+            with open(secrets_file, "r") as f:
+                file_secrets = yaml_safe_load(f)
+        except FileNotFoundError:
+            if "TELEGRAM_BOT_TOKEN" not in env_secrets:
+                raise FileNotFoundError(
+                    f"Secrets file not found: {secrets_path}"
+                ) from None
+            file_secrets = {}
+        file_secrets = file_secrets if isinstance(file_secrets, dict) else {}
         self._secrets_path = secrets_file
-        self._secrets_data = secrets
+        # File contents only: env overrides are never written back by the save helpers.
+        self._secrets_data = file_secrets
+        secrets = _secrets_with_env_overrides(file_secrets, env_secrets)
 
         telegram_secrets = secrets.get("telegram", {})
         if not telegram_secrets:
@@ -199,7 +290,8 @@ class TelegramBotInterface:
         self.token = telegram_secrets.get("token")
         if not self.token:
             raise ValueError(
-                f"No 'token' found in telegram section of secrets file: {secrets_path}"
+                f"No 'token' found in telegram section of secrets file: {secrets_path} "
+                "(or set TELEGRAM_BOT_TOKEN)"
             )
 
         self.chat_id = telegram_secrets.get("chat_id")
@@ -279,6 +371,8 @@ class TelegramBotInterface:
         self.video_fps = int(video_cfg.get("fps", 10))
         self.video_duration = float(video_cfg.get("duration", 3))
         self.video_format = str(video_cfg.get("format", "mp4")).lower().strip()
+        # ``h264`` (avc1) gives far smaller files than mp4v when OpenCV's backend has it.
+        self.video_codec = str(video_cfg.get("codec", "mp4v")).lower().strip()
 
         self.max_file_size_mb = self.config.get("max_file_size_mb", 50.0)
         self.notification_rate_limit = self.config.get("notification_rate_limit", 5)
@@ -650,7 +744,10 @@ class TelegramBotInterface:
         if not isinstance(auth, dict):
             auth = {}
             self._secrets_data["authentication"] = auth
-        if self._setup_password:
+        if (
+            self._setup_password
+            and "SECURITY_SETUP_PASSWORD" not in self._env_secret_vars
+        ):
             auth["setup_password"] = self._setup_password
         auth["superuser_id"] = self._superuser_id
         auth["user_whitelist"] = sorted(set(self._user_whitelist))
@@ -2754,8 +2851,12 @@ class TelegramBotInterface:
                 persist_path = self.media_store.new_artifact_path(
                     event.camera_id, event.stage, "gif"
                 )
-            gif_path = self._create_gif_with_overlay(
-                event.frames, event.overlays, out_path=persist_path
+            # Encode off the event loop so bot commands stay responsive meanwhile.
+            gif_path = await asyncio.to_thread(
+                self._create_gif_with_overlay,
+                event.frames,
+                event.overlays,
+                out_path=persist_path,
             )
 
             if not gif_path or not gif_path.exists():
@@ -2843,6 +2944,11 @@ class TelegramBotInterface:
             return ".avi", cv2.VideoWriter_fourcc(*"XVID")
         if fmt not in ("mp4", "mkv"):
             self.logger.warning("Unknown video format %r, using mp4", fmt)
+        codec = self.video_codec or "mp4v"
+        if codec in ("h264", "avc1"):
+            return ".mp4", cv2.VideoWriter_fourcc(*"avc1")
+        if codec != "mp4v":
+            self.logger.warning("Unknown video codec %r, using mp4v", codec)
         return ".mp4", cv2.VideoWriter_fourcc(*"mp4v")
 
     async def _send_video_notification(
@@ -2861,8 +2967,11 @@ class TelegramBotInterface:
                 persist_path = self.media_store.new_artifact_path(
                     event.camera_id, event.stage, kind
                 )
-            video_path = self._create_video_with_overlay(
-                event.frames, event.overlays, out_path=persist_path
+            video_path = await asyncio.to_thread(
+                self._create_video_with_overlay,
+                event.frames,
+                event.overlays,
+                out_path=persist_path,
             )
             if not video_path or not video_path.exists():
                 await self._send_text_notification(
@@ -2926,12 +3035,10 @@ class TelegramBotInterface:
             else:
                 frame_arrays = frames
 
-            max_frames = int(self.video_duration * self.video_fps)
-            frame_indices = list(range(len(frame_arrays)))
-            if len(frame_arrays) > max_frames:
-                step = len(frame_arrays) / max_frames
-                frame_indices = [int(i * step) for i in range(max_frames)]
-                frame_arrays = [frame_arrays[i] for i in frame_indices]
+            frame_indices = _sample_indices(
+                len(frame_arrays), int(self.video_duration * self.video_fps)
+            )
+            frame_arrays = [frame_arrays[i] for i in frame_indices]
 
             sampled_overlays: Optional[List] = None
             if overlays and len(overlays) > 0:
@@ -2947,8 +3054,6 @@ class TelegramBotInterface:
             video_frames: List = []
             for i, frame in enumerate(frame_arrays):
                 bgr = frame
-                if len(bgr.shape) == 3 and bgr.shape[2] == 3:
-                    bgr = bgr.copy()
                 if sampled_overlays and i < len(sampled_overlays):
                     overlay = sampled_overlays[i]
                     if (
@@ -2959,13 +3064,10 @@ class TelegramBotInterface:
                         ov = overlay
                         if ov.shape[:2] != bgr.shape[:2]:
                             ov = cv2.resize(ov, (bgr.shape[1], bgr.shape[0]))
-                        mask = ov.sum(axis=2) > 0
-                        bgr[mask] = ov[mask]
-                h, w = bgr.shape[:2]
-                if w > 1280:
-                    scale = 1280 / w
-                    new_size = (int(w * scale), int(h * scale))
-                    bgr = cv2.resize(bgr, new_size)
+                        # Copy only when blending: the queued frame may be reused by GIF.
+                        bgr = bgr.copy()
+                        _paste_overlay(bgr, ov)
+                bgr = _fit_notification_width(bgr)
                 video_frames.append(bgr)
 
             if not video_frames:
@@ -2983,6 +3085,15 @@ class TelegramBotInterface:
             writer = cv2.VideoWriter(
                 str(out_path), fourcc, float(self.video_fps), (w, h)
             )
+            mp4v = cv2.VideoWriter_fourcc(*"mp4v")
+            if not writer.isOpened() and ext == ".mp4" and fourcc != mp4v:
+                # OpenCV builds without an H.264 encoder: fall back to mp4v.
+                self.logger.warning(
+                    "H.264 encoder unavailable, falling back to mp4v for %s", out_path
+                )
+                writer = cv2.VideoWriter(
+                    str(out_path), mp4v, float(self.video_fps), (w, h)
+                )
             if not writer.isOpened():
                 self.logger.error("VideoWriter failed to open for %s", out_path)
                 return None
@@ -3022,13 +3133,10 @@ class TelegramBotInterface:
                 frame_arrays = frames
 
             # Limit frames based on duration and FPS
-            max_frames = int(self.gif_duration * self.gif_fps)
-            frame_indices = list(range(len(frame_arrays)))
-            if len(frame_arrays) > max_frames:
-                # Sample evenly
-                step = len(frame_arrays) / max_frames
-                frame_indices = [int(i * step) for i in range(max_frames)]
-                frame_arrays = [frame_arrays[i] for i in frame_indices]
+            frame_indices = _sample_indices(
+                len(frame_arrays), int(self.gif_duration * self.gif_fps)
+            )
+            frame_arrays = [frame_arrays[i] for i in frame_indices]
 
             # Sample overlays to match frame indices if available
             sampled_overlays = None
@@ -3043,43 +3151,42 @@ class TelegramBotInterface:
                     else:
                         sampled_overlays.append(None)
 
-            # Apply overlays if available
-            gif_frames = []
+            # Apply overlays if available. Paste and downscale in BGR, then convert the
+            # (smaller) result once: swapping channels commutes with both steps. Each
+            # frame is palettized right away (1 byte/pixel held until save) with Pillow's
+            # fast octree quantizer; the GIF encoder's default median cut is ~20x slower.
+            palette_frames: List[Image.Image] = []
             for i, frame in enumerate(frame_arrays):
-                # Convert BGR to RGB
-                if len(frame.shape) == 3 and frame.shape[2] == 3:
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                else:
-                    rgb_frame = frame
-
-                # Apply overlay if available
+                out = frame
                 if sampled_overlays and i < len(sampled_overlays):
                     overlay = sampled_overlays[i]
-                    if overlay is not None and overlay.size > 0:
-                        # Blend overlay (assuming overlay is BGR)
-                        if len(overlay.shape) == 3:
-                            overlay_rgb = cv2.cvtColor(overlay, cv2.COLOR_BGR2RGB)
-                        else:
-                            overlay_rgb = overlay
-
+                    if (
+                        overlay is not None
+                        and overlay.size > 0
+                        and len(overlay.shape) == 3
+                    ):
                         # Resize overlay to match frame if needed
-                        if overlay_rgb.shape[:2] != rgb_frame.shape[:2]:
-                            overlay_rgb = cv2.resize(
-                                overlay_rgb, (rgb_frame.shape[1], rgb_frame.shape[0])
+                        if overlay.shape[:2] != frame.shape[:2]:
+                            overlay = cv2.resize(
+                                overlay, (frame.shape[1], frame.shape[0])
                             )
-
                         # Blend: overlay non-black pixels
-                        mask = overlay_rgb.sum(axis=2) > 0
-                        rgb_frame[mask] = overlay_rgb[mask]
+                        out = frame.copy()
+                        _paste_overlay(out, overlay)
 
                 # Resize for GIF optimization
-                h, w = rgb_frame.shape[:2]
-                if w > 1280:
-                    scale = 1280 / w
-                    new_size = (int(w * scale), int(h * scale))
-                    rgb_frame = cv2.resize(rgb_frame, new_size)
+                out = _fit_notification_width(out)
 
-                gif_frames.append(rgb_frame)
+                # Convert BGR to RGB
+                if len(out.shape) == 3 and out.shape[2] == 3:
+                    out = cv2.cvtColor(out, cv2.COLOR_BGR2RGB)
+
+                pil = Image.fromarray(out)
+                if pil.mode != "RGB":
+                    pil = pil.convert("RGB")
+                palette_frames.append(
+                    pil.quantize(256, method=Image.Quantize.FASTOCTREE)
+                )
 
             if out_path is not None:
                 gif_path = Path(out_path)
@@ -3087,10 +3194,18 @@ class TelegramBotInterface:
             else:
                 gif_path = Path(f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.gif")
 
-            # Generate GIF
-            imageio.mimsave(
-                str(gif_path), gif_frames, format="GIF", fps=self.gif_fps, loop=0
-            )
+            try:
+                palette_frames[0].save(
+                    str(gif_path),
+                    format="GIF",
+                    save_all=True,
+                    append_images=palette_frames[1:],
+                    duration=1000.0 / self.gif_fps,
+                    loop=0,
+                )
+            except Exception:
+                gif_path.unlink(missing_ok=True)
+                raise
 
             return gif_path
 
@@ -3124,39 +3239,20 @@ class TelegramBotInterface:
                 row.append(None)
         return row
 
-    @staticmethod
-    def _copy_buffer(arr: Any) -> Any:
-        """Deep-copy numpy frame/overlay so async GIF/video send survives rolling-buffer reuse."""
-        if arr is None:
-            return None
-        if isinstance(arr, np.ndarray):
-            return np.copy(arr)
-        copy_fn = getattr(arr, "copy", None)
-        if callable(copy_fn):
-            try:
-                return copy_fn()
-            except Exception:
-                return arr
-        return arr
-
     def _snapshot_notification_frames(
         self, frames_to_use: List[Any]
     ) -> Optional[List[Dict[str, Any]]]:
-        """Copy camera frames for the notification queue (see CamGrabber.record() — refs only)."""
+        """Wrap camera frames for the notification queue.
+
+        Frames come out of CamGrabber's Manager list, so every ``record()``/``snap()``
+        already yields freshly unpickled arrays owned by this cycle's result; copying
+        them again here only doubled the memory traffic per alert.
+        """
         if not frames_to_use:
             return None
-        out: List[Dict[str, Any]] = []
-        for f in frames_to_use:
-            if f is None:
-                continue
-            out.append({"frame": self._copy_buffer(f)})
+        out = [{"frame": f} for f in frames_to_use if f is not None]
         return out if out else None
 
-    def _snapshot_overlays(self, overlays: Optional[List[Any]]) -> Optional[List[Any]]:
-        if not overlays:
-            return overlays
-        return [self._copy_buffer(o) for o in overlays]
-
     def process(self, result: Dict[str, Any]) -> None:
         """
         Process result from orchestrator.
@@ -3277,9 +3373,7 @@ class TelegramBotInterface:
                         [result.get("snap")] if result.get("snap") is not None else []
                     )
                 frames = self._snapshot_notification_frames(frames_to_use)
-                overlays = self._snapshot_overlays(
-                    self._overlay_row(data_list, len(frames_to_use))
-                )
+                overlays = self._overlay_row(data_list, len(frames_to_use))
                 event = NotificationEvent(
                     message=f"🙂 Face identified on camera {camera_id}",
                     event_type="face",
@@ -3301,9 +3395,7 @@ class TelegramBotInterface:
                     [result.get("snap")] if result.get("snap") is not None else []
                 )
             frames = self._snapshot_notification_frames(frames_to_use)
-            overlays = self._snapshot_overlays(
-                self._overlay_row(detection_data, len(frames_to_use))
-            )
+            overlays = self._overlay_row(detection_data, len(frames_to_use))
             event = NotificationEvent(
                 message=f"🚨 Person detected on camera {camera_id}!",
                 event_type="person",
@@ -3330,9 +3422,7 @@ class TelegramBotInterface:
                     [result.get("snap")] if result.get("snap") is not None else []
                 )
             frames = self._snapshot_notification_frames(frames_to_use)
-            overlays = self._snapshot_overlays(
-                self._overlay_row(motion_data, len(frames_to_use))
-            )
+            overlays = self._overlay_row(motion_data, len(frames_to_use))
             event = NotificationEvent(
                 message=f"👀 Motion detected on camera {camera_id}",
                 event_type="motion",
@@ -27,6 +27,7 @@ from .authz import Principal, auth_state_from_config, can
 from .memory_manager import MemoryManager, EventType
 from ..runtime import DEPRECATED_CONFIG_KEYS
 from ..shared_theme_css import SHARED_DASHBOARD_THEME_CSS
+from ..yaml_io import safe_load as yaml_safe_load
 
 
 class EventResponse(BaseModel):
@@ -127,13 +128,17 @@ async def require_control_api_key(request: Request) -> None:
         raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
 
+# Resolved once at import; template/static lookups run per request.
+_INTERFACE_DIR = Path(__file__).resolve().parent
+_TEMPLATES_DIR = _INTERFACE_DIR / "templates"
+
 # IPv4 any-address default; avoids a literal bind-all string that trips static analysis.
 _DEFAULT_WEBAPP_HOST = str(ipaddress.IPv4Address(0))
 
 
 def _resolve_brand_static_dir() -> Optional[Path]:
     """Dashboard icons shipped with the package under ``spyoncino/static`` (wheel and editable)."""
-    bundled = Path(__file__).resolve().parent.parent / "static"
+    bundled = _INTERFACE_DIR.parent / "static"
     if (bundled / "logo.ico").is_file():
         return bundled
     return None
@@ -222,17 +227,9 @@ class WebAppInterface:
         )
 
     def _load_auth_data(self) -> Dict[str, Any]:
-        if not self.secrets_path.exists():
-            return {
-                "setup_password": None,
-                "superuser_id": None,
-                "user_whitelist": [],
-                "allow_group_commands": True,
-                "silent_unauthorized": True,
-            }
         try:
             with open(self.secrets_path, "r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
+                raw = yaml_safe_load(f) or {}
             auth = raw.get("authentication") or {}
             if not isinstance(auth, dict):
                 auth = {}
@@ -254,15 +251,25 @@ class WebAppInterface:
             )
             out["session_secret"] = str(out.get("session_secret") or "").strip() or None
             return out
+        except FileNotFoundError:
+            return {
+                "setup_password": None,
+                "superuser_id": None,
+                "user_whitelist": [],
+                "allow_group_commands": True,
+                "silent_unauthorized": True,
+            }
         except Exception as e:
             self.logger.warning("Failed to load auth config: %s", e)
             return {"setup_password": None, "superuser_id": None, "user_whitelist": []}
 
     def _save_auth_data(self) -> None:
         data: Dict[str, Any] = {}
-        if self.secrets_path.exists():
+        try:
             with open(self.secrets_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml_safe_load(f) or {}
+        except FileNotFoundError:
+            pass
         if not isinstance(data, dict):
             data = {}
         auth = data.get("authentication")
@@ -1391,7 +1398,7 @@ class WebAppInterface:
     def _get_login_html(self) -> str:
         fav = self._favicon_link_tags()
         shared_css = self._shared_theme_css()
-        template_path = Path(__file__).resolve().parent / "templates" / "login.html"
+        template_path = _TEMPLATES_DIR / "login.html"
         try:
             template = template_path.read_text(encoding="utf-8")
         except OSError as exc:
@@ -1404,7 +1411,7 @@ class WebAppInterface:
         """Get HTML UI for web interface."""
         fav = self._favicon_link_tags()
         shared_css = self._shared_theme_css()
-        template_path = Path(__file__).resolve().parent / "templates" / "dashboard.html"
+        template_path = _TEMPLATES_DIR / "dashboard.html"
         try:
             template = template_path.read_text(encoding="utf-8")
         except OSError as exc:
@@ -13,6 +13,13 @@ from typing import Optional
 
 
 _SAFE_CAM = re.compile(r"[^a-zA-Z0-9._-]+")
+_EXT_MAP = {
+    "gif": ".gif",
+    "mp4": ".mp4",
+    "jpeg": ".jpg",
+    "jpg": ".jpg",
+    "avi": ".avi",
+}
 
 
 def _safe_camera_segment(camera_id: str) -> str:
@@ -35,20 +42,15 @@ class MediaStore:
 
         kind: logical type — gif, mp4, jpeg (jpg), etc.
         """
-        self.ensure_root()
-        ext_map = {
-            "gif": ".gif",
-            "mp4": ".mp4",
-            "jpeg": ".jpg",
-            "jpg": ".jpg",
-            "avi": ".avi",
-        }
-        ext = ext_map.get(kind.lower().strip(), f".{kind.lower().strip().lstrip('.')}")
+        kind_key = kind.lower().strip()
+        ext = _EXT_MAP.get(kind_key, f".{kind_key.lstrip('.')}")
         stage_safe = _SAFE_CAM.sub("_", (stage or "unknown").strip())[:64] or "unknown"
-        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+        now = datetime.now(timezone.utc)
+        day = now.strftime("%Y-%m-%d")
+        ts = now.strftime("%Y%m%d_%H%M%S_%f")
         cam = _safe_camera_segment(camera_id)
         subdir = self.root / cam / day
+        # Not cached: the media root or a day folder may be removed externally at runtime.
         subdir.mkdir(parents=True, exist_ok=True)
         return subdir / f"{stage_safe}_{ts}{ext}"
 
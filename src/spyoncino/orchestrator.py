@@ -5,19 +5,22 @@ Coordinates inputs, preprocessing, inference, and interfaces.
 Collects general metrics and events for permanent storage.
 """
 
+from __future__ import annotations
+
 import time
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import threading
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from pathlib import Path
 
-from .input.cam_grabber import CamGrabber
-from .preproc.motion_detection import MotionDetection
-from .inference.object_detection import ObjectDetection
 from .interface.memory_manager import MemoryManager, EventType
 from .media_store import MediaStore
 from .recipe_classes import resolve_recipe_class
@@ -28,7 +31,139 @@ from .recipe_paths import (
     resolve_secrets_path,
     sqlite_path_from_recipe,
 )
-from .runtime import SpyoncinoRuntime
+
+# Heavy modules (cv2, torch/ultralytics) load in ``build()`` so ``--help``, argument errors
+# and the discover / recipe-builder subcommands start without them.
+if TYPE_CHECKING:
+    from .input.cam_grabber import CamGrabber
+    from .preproc.motion_detection import MotionDetection
+    from .inference.object_detection import ObjectDetection
+    from .runtime import SpyoncinoRuntime
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# One formatter shared by the console and file handlers (format string validated once).
+_LOG_FORMATTER = logging.Formatter(_LOG_FORMAT)
+# Records buffered in memory before a bulk write to the log file (WARNING flushes at once).
+_LOG_BUFFER_CAPACITY = 512
+# Oldest buffered record is written out after this long, even if the buffer is not full:
+# a quiet daemon must not keep INFO lines in memory for hours (lost on SIGKILL / OOM).
+_LOG_FLUSH_INTERVAL_S = 5.0
+# Third-party loggers that are chatty at INFO (httpx logs every Telegram long-poll request).
+_NOISY_LOGGERS = (
+    ("httpx", logging.WARNING),
+    ("httpcore", logging.WARNING),
+    ("apscheduler", logging.WARNING),
+    ("ultralytics", logging.WARNING),
+)
+_log_buffer: Optional[_BufferedLogHandler] = None
+_logging_configured = False
+
+
+def _setup_logging() -> None:
+    """
+    Console logging for the CLI (stderr). Runs once per process; ``force=True`` drops
+    handlers installed earlier (e.g. by an imported library) so records are not duplicated.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    console = logging.StreamHandler()
+    console.setFormatter(_LOG_FORMATTER)
+    logging.basicConfig(level=logging.INFO, handlers=[console], force=True)
+    for name, level in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(level)
+
+
+class _BufferedLogHandler(logging.handlers.MemoryHandler):
+    """``MemoryHandler`` that also flushes once its oldest buffered record is stale."""
+
+    def __init__(self, *args: Any, max_age_s: float, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_age_s = max_age_s
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        # The patrol thread calls this while other threads emit / flush; the handler lock
+        # is re-entrant, so it is also safe from ``shouldFlush`` inside ``emit``.
+        with self.lock:
+            if not self.buffer:
+                return False
+            oldest = self.buffer[0].created
+        return (time.time() if now is None else now) - oldest >= self.max_age_s
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or self.is_stale(record.created)
+
+
+def _attach_file_logging(recipe: Dict[str, Any]) -> Optional[Path]:
+    """
+    Optional rotating log file from the recipe ``logging`` block.
+
+    The file handler sits behind a :class:`logging.handlers.MemoryHandler` so hot-path
+    ``info`` records are written in batches instead of one ``write()`` per record.
+    ``WARNING`` and above flush at once; older records go out within
+    ``_LOG_FLUSH_INTERVAL_S`` (checked on emit and by the patrol loop).
+    """
+    global _log_buffer
+    cfg = recipe.get("logging") or {}
+    raw = cfg.get("file") if isinstance(cfg, dict) else None
+    if not raw or _log_buffer is not None:
+        return None
+    log_path = resolve_path_for_recipe(recipe, str(raw))
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=max(0, int(float(cfg.get("max_mb", 10)) * 1024 * 1024)),
+        backupCount=max(0, int(cfg.get("backup_count", 5))),
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(_LOG_FORMATTER)
+    _log_buffer = _BufferedLogHandler(
+        capacity=_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+        max_age_s=_LOG_FLUSH_INTERVAL_S,
+    )
+    logging.getLogger().addHandler(_log_buffer)
+    atexit.register(_log_buffer.flush)
+    return log_path
+
+
+def _flush_file_logging(stale_only: bool = False) -> None:
+    if _log_buffer is None or (stale_only and not _log_buffer.is_stale()):
+        return
+    _log_buffer.flush()
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionSettings:
+    """Recipe ``media`` / ``event_log`` retention knobs, parsed once in ``build()``."""
+
+    media_every_n_cycles: int = 120
+    media_retention_days: Optional[int] = None
+    media_max_total_mb: Optional[float] = None
+    media_max_files_per_camera: Optional[int] = None
+    event_log_retention_days: int = 3
+    event_log_every_n_cycles: int = 120
+
+    @classmethod
+    def from_recipe(cls, recipe: Dict[str, Any]) -> RetentionSettings:
+        media_cfg = recipe.get("media") or {}
+        el_cfg = recipe.get("event_log") or {}
+        if not isinstance(el_cfg, dict):
+            el_cfg = {}
+        media_every = int(media_cfg.get("retention_every_n_cycles", 120))
+        return cls(
+            media_every_n_cycles=media_every,
+            media_retention_days=media_cfg.get("retention_days"),
+            media_max_total_mb=media_cfg.get("max_total_mb"),
+            media_max_files_per_camera=media_cfg.get("max_files_per_camera"),
+            event_log_retention_days=int(el_cfg.get("retention_days", 3)),
+            event_log_every_n_cycles=int(
+                el_cfg.get("retention_every_n_cycles", media_every)
+            ),
+        )
 
 
 class Orchestrator:
@@ -60,12 +195,7 @@ class Orchestrator:
         self._paused = False
         self.media_store: Optional[MediaStore] = None
         self.runtime: Optional[SpyoncinoRuntime] = None
-        self._retention_every_n_cycles = 120
-        self._media_retention_days: Optional[int] = None
-        self._media_max_total_mb: Optional[float] = None
-        self._media_max_files_per_camera: Optional[int] = None
-        self._event_log_retention_days = 3
-        self._event_retention_every_n_cycles = 120
+        self._retention = RetentionSettings()
         self._restart_delay_seconds = int(recipe.get("restart_delay_seconds", 45) or 45)
         self._restart_scheduled_at: Optional[datetime] = None
         self._restart_reason: Optional[str] = None
@@ -182,11 +312,20 @@ class Orchestrator:
             )
         except Exception:
             self.logger.debug("failed to log restart event", exc_info=True)
+        # execv skips atexit/daemon cleanup: release cameras so the new process can open them.
+        self._stop_inputs()
+        _flush_file_logging()
         try:
             # Intentional process replacement for scheduled self-restart (no shell).
             os.execv(sys.executable, [sys.executable, *sys.argv])  # nosec B606
         except Exception as e:
+            # Still this process: resume capture and drop the schedule so the patrol loop
+            # does not stop the cameras again on every cycle.
             self.logger.error("Self-restart failed: %s", e, exc_info=True)
+            with self._control_lock:
+                self._restart_scheduled_at = None
+                self._restart_reason = None
+            self._start_inputs()
 
     def build(self) -> None:
         """Build all components from recipe."""
@@ -274,35 +413,21 @@ class Orchestrator:
             root_path = resolve_path_for_recipe(self.recipe, str(media_root))
             self.media_store = MediaStore(root_path)
             self.media_store.ensure_root()
-            self._retention_every_n_cycles = int(
-                media_cfg.get("retention_every_n_cycles", 120)
-            )
-            self._media_retention_days = media_cfg.get("retention_days")
-            self._media_max_total_mb = media_cfg.get("max_total_mb")
-            self._media_max_files_per_camera = media_cfg.get("max_files_per_camera")
+            self._retention = RetentionSettings.from_recipe(self.recipe)
+            from .runtime import SpyoncinoRuntime
+
             self.runtime = SpyoncinoRuntime(self, self.media_store)
             self.logger.info(
                 "Media store at %s (retention_days=%s, max_total_mb=%s, max_files_per_camera=%s)",
                 root_path,
-                self._media_retention_days,
-                self._media_max_total_mb,
-                self._media_max_files_per_camera,
-            )
-
-            el_cfg = self.recipe.get("event_log") or {}
-            if not isinstance(el_cfg, dict):
-                el_cfg = {}
-            self._event_log_retention_days = int(el_cfg.get("retention_days", 3))
-            self._event_retention_every_n_cycles = int(
-                el_cfg.get(
-                    "retention_every_n_cycles",
-                    media_cfg.get("retention_every_n_cycles", 120),
-                )
+                self._retention.media_retention_days,
+                self._retention.media_max_total_mb,
+                self._retention.media_max_files_per_camera,
             )
             self.logger.info(
                 "Event log DB retention: retention_days=%s, every_n_cycles=%s",
-                self._event_log_retention_days,
-                self._event_retention_every_n_cycles,
+                self._retention.event_log_retention_days,
+                self._retention.event_log_every_n_cycles,
             )
 
             self.logger.info("Building interfaces...")
@@ -399,25 +524,23 @@ class Orchestrator:
         return getattr(module, class_name)
 
     def _update_service_status(self) -> None:
-        """Update service status in memory manager."""
+        """
+        Update service status in memory manager. Rows carry ``last_check`` / ``uptime`` for
+        the dashboard, so they are rewritten every cycle, all in one SQLite transaction.
+        """
         uptime = (datetime.now() - self.start_time).total_seconds()
-
-        # Update orchestrator status
-        self.memory_manager.update_service_status(
-            "orchestrator", is_running=self.running, uptime_seconds=uptime
-        )
-
-        # Update input statuses
+        statuses = [("orchestrator", self.running, None, uptime)]
         for input_cam in self.inputs:
-            self.memory_manager.update_service_status(
-                f"input_{input_cam.cam_id}",
-                is_running=input_cam.running
-                if hasattr(input_cam, "running")
-                else False,
-                last_error=None
-                if (hasattr(input_cam, "connected") and input_cam.connected)
-                else "Camera disconnected",
+            connected = hasattr(input_cam, "connected") and input_cam.connected
+            statuses.append(
+                (
+                    f"input_{input_cam.cam_id}",
+                    input_cam.running if hasattr(input_cam, "running") else False,
+                    None if connected else "Camera disconnected",
+                    None,
+                )
             )
+        self.memory_manager.update_services_status(statuses)
 
     def _process_input(self, input_cam: CamGrabber) -> Optional[Dict[str, Any]]:
         """
@@ -436,11 +559,9 @@ class Orchestrator:
             # Procedure: capture, preprocess, infer
             # -------------------------------------------------------------------------
             # Get snap and record
-            self.logger.info(f"Getting snap from camera {camera_id}")
+            cycle_t0 = time.perf_counter()
             snap = input_cam.snap()
-            self.logger.info(f"Got snap, getting record from camera {camera_id}")
             record = input_cam.record()
-            self.logger.info(f"Got record from camera {camera_id}")
 
             if snap is None:
                 self.logger.warning(f"Snap is None for camera {camera_id}, skipping")
@@ -465,77 +586,56 @@ class Orchestrator:
             peak_result = None
             frames_with_labels = []
             object_detected = False
+            od_ran = False
             frames_with_motion = []
             motion_detected = False
             face_identified = False
             face_result = None
 
             if motion_detector:
-                self.logger.info(f"Running motion peak detection on camera {camera_id}")
                 is_peak, motion_percent, fg_mask = motion_detector.peak(
                     camera_id, snap_frame
                 )
                 peak_result = {"motion_percent": motion_percent, "fg_mask": fg_mask}
-                self.logger.info(f"Motion peak detection completed: is_peak={is_peak}")
 
                 if is_peak:
                     # Motion detected, run object detection
                     if object_detector:
-                        self.logger.info(
-                            f"Running object detection on camera {camera_id}"
-                        )
                         frames_with_labels, object_detected = object_detector.detect(
                             record_frames
                         )
-                        self.logger.info(
-                            f"Object detection completed: detected={object_detected}"
-                        )
+                        od_ran = True
 
                     # If no object detected, run motion detection on record
                     if not object_detected and motion_detector:
-                        self.logger.info(
-                            f"Running motion detection on record frames for camera {camera_id}"
-                        )
                         frames_with_motion, motion_detected = motion_detector.detect(
                             camera_id, record_frames
                         )
-                        self.logger.info(
-                            f"Motion detection on record completed: detected={motion_detected}"
-                        )
                 else:
                     # No peak motion, but check record frames for motion
                     if motion_detector:
-                        self.logger.info(
-                            f"Running motion detection on record frames for camera {camera_id}"
-                        )
                         frames_with_motion, motion_detected = motion_detector.detect(
                             camera_id, record_frames
                         )
-                        self.logger.info(
-                            f"Motion detection on record completed: detected={motion_detected}"
-                        )
             else:
                 # No motion detector, just run object detection
                 if object_detector:
-                    self.logger.info(f"Running object detection on camera {camera_id}")
                     frames_with_labels, object_detected = object_detector.detect(
                         record_frames
                     )
-                    self.logger.info(
-                        f"Object detection completed: detected={object_detected}"
-                    )
 
             # Face post-processing needs YOLO boxes on the record. OD only ran above on a motion *peak*;
             # if the buffer shows motion without a peak, run OD once so face_identification can still run.
+            # Skip when OD already ran on this record: the same frames give the same (empty) result.
             if (
                 motion_detector
                 and object_detector
                 and face_identifier
                 and bool(getattr(face_identifier, "enabled", False))
-                and not object_detected
+                and not od_ran
                 and motion_detected
             ):
-                self.logger.info(
+                self.logger.debug(
                     "Record motion without prior person alarm — running object detection for face pipeline "
                     "on camera %s",
                     camera_id,
@@ -543,49 +643,32 @@ class Orchestrator:
                 frames_with_labels, object_detected = object_detector.detect(
                     record_frames
                 )
-                self.logger.info(
-                    "Object detection (for face) completed: detected=%s",
-                    object_detected,
-                )
 
-            if face_identifier:
-                if object_detected:
-                    self.logger.info(
-                        f"Running face identification on camera {camera_id}"
-                    )
-                    identify_kw: Dict[str, Any] = {
-                        "camera_id": camera_id,
-                        "memory_manager": self.memory_manager,
-                        "media_store": self.media_store,
-                    }
-                    try:
-                        sig = inspect.signature(face_identifier.identify)
-                        supported = set(sig.parameters.keys())
-                        has_varkw = any(
-                            p.kind == inspect.Parameter.VAR_KEYWORD
-                            for p in sig.parameters.values()
-                        )
-                    except (TypeError, ValueError):
-                        supported = set()
-                        has_varkw = False
-                    if has_varkw:
-                        call_kw = dict(identify_kw)
-                    else:
-                        call_kw = {
-                            k: v for k, v in identify_kw.items() if k in supported
-                        }
-                    face_identified, face_result = face_identifier.identify(
-                        record_frames,
-                        frames_with_labels,
-                        **call_kw,
-                    )
-                    self.logger.info(
-                        f"Face identification completed: identified={face_identified}"
+            if face_identifier and object_detected:
+                identify_kw: Dict[str, Any] = {
+                    "camera_id": camera_id,
+                    "memory_manager": self.memory_manager,
+                    "media_store": self.media_store,
+                }
+                try:
+                    sig = inspect.signature(face_identifier.identify)
+                    supported = set(sig.parameters.keys())
+                    has_varkw = any(
+                        p.kind == inspect.Parameter.VAR_KEYWORD
+                        for p in sig.parameters.values()
                     )
+                except (TypeError, ValueError):
+                    supported = set()
+                    has_varkw = False
+                if has_varkw:
+                    call_kw = dict(identify_kw)
                 else:
-                    self.logger.info(
-                        f"No object detected, skipping face identification on camera {camera_id}"
-                    )
+                    call_kw = {k: v for k, v in identify_kw.items() if k in supported}
+                face_identified, face_result = face_identifier.identify(
+                    record_frames,
+                    frames_with_labels,
+                    **call_kw,
+                )
 
             peak_payload: Dict[str, Any] = {
                 "alarmed": is_peak if motion_detector else False,
@@ -604,6 +687,20 @@ class Orchestrator:
                 "data": face_result,
             }
 
+            # One summary line per camera per cycle (INFO only when a stage alarmed).
+            self.logger.log(
+                logging.INFO
+                if (is_peak or motion_detected or object_detected or face_identified)
+                else logging.DEBUG,
+                "Camera %s: peak=%s motion=%s detection=%s face=%s (%.2fs)",
+                camera_id,
+                is_peak,
+                motion_detected,
+                object_detected,
+                face_identified,
+                time.perf_counter() - cycle_t0,
+            )
+
             # -------------------------------------------------------------------------
             # Result construction
             # -------------------------------------------------------------------------
@@ -722,9 +819,8 @@ class Orchestrator:
             while self.running:
                 self._sync_patrol_time_from_db()
                 self._maybe_execute_scheduled_restart()
+                _flush_file_logging(stale_only=True)
                 cycle_start = time.time()
-                if self.total_cycles % 10 == 0:  # Log every 10 cycles
-                    self.logger.info(f"Cycle {self.total_cycles + 1} started")
 
                 # Update service status
                 self._update_service_status()
@@ -737,40 +833,21 @@ class Orchestrator:
                     if sleep_time > 0:
                         time.sleep(sleep_time)
                     self.total_cycles += 1
-                    if (
-                        self.media_store
-                        and self._retention_every_n_cycles > 0
-                        and self.total_cycles % self._retention_every_n_cycles == 0
-                    ):
-                        self._maybe_run_media_retention()
-                    if (
-                        self._event_retention_every_n_cycles > 0
-                        and self.total_cycles % self._event_retention_every_n_cycles
-                        == 0
-                    ):
-                        self._maybe_run_event_log_retention()
+                    self._run_periodic_retention()
                     continue
 
                 # Process all inputs
                 for input_cam in self.inputs:
-                    self.logger.info(f"Processing input: {input_cam.cam_id}")
                     result = self._process_input(input_cam)
-                    self.logger.info(f"Input {input_cam.cam_id} processed")
 
                     if result:
                         # Send to all interfaces
                         for interface in self.interfaces:
                             try:
-                                self.logger.info(
-                                    f"Sending result to interface: {interface.__class__.__name__}"
-                                )
                                 if hasattr(interface, "process"):
                                     interface.process(result)
                                 elif hasattr(interface, "handle_event"):
                                     interface.handle_event(result)
-                                self.logger.info(
-                                    f"Interface {interface.__class__.__name__} processed"
-                                )
                             except Exception as e:
                                 self.logger.error(
                                     f"Error in interface {interface.__class__.__name__}: {e}",
@@ -778,23 +855,12 @@ class Orchestrator:
                                 )
 
                 self.total_cycles += 1
-
-                if (
-                    self.media_store
-                    and self._retention_every_n_cycles > 0
-                    and self.total_cycles % self._retention_every_n_cycles == 0
-                ):
-                    self._maybe_run_media_retention()
-                if (
-                    self._event_retention_every_n_cycles > 0
-                    and self.total_cycles % self._event_retention_every_n_cycles == 0
-                ):
-                    self._maybe_run_event_log_retention()
+                self._run_periodic_retention()
 
                 # Save metrics snapshot periodically (every 60 cycles)
                 if self.total_cycles % 60 == 0:
-                    self.logger.info(
-                        f"Saving metrics snapshot (cycle {self.total_cycles})"
+                    self.logger.debug(
+                        "Saving metrics snapshot (cycle %s)", self.total_cycles
                     )
                     metrics = self.memory_manager.get_current_metrics()
                     self.memory_manager.save_metrics_snapshot(metrics)
@@ -822,6 +888,7 @@ class Orchestrator:
     def stop(self) -> None:
         """Stop the orchestrator."""
         self.running = False
+        self._stop_inputs()
         self.logger.info("Orchestrator stopped")
 
         self.memory_manager.log_event(
@@ -830,6 +897,51 @@ class Orchestrator:
 
         # Update final status
         self._update_service_status()
+        _flush_file_logging()
+
+    def _start_inputs(self) -> None:
+        """Restart camera grab processes stopped by ``_stop_inputs``."""
+        for grabber in self.inputs:
+            if not hasattr(grabber, "start"):
+                continue
+            try:
+                grabber.start()
+            except Exception as e:
+                self.logger.error(
+                    "Error starting input %s: %s", getattr(grabber, "cam_id", "?"), e
+                )
+
+    def _stop_inputs(self) -> None:
+        """Stop camera grab processes in parallel (each join waits up to its own timeout)."""
+        grabbers = [i for i in self.inputs if hasattr(i, "stop")]
+        if not grabbers:
+            return
+
+        def _stop_one(grabber: Any) -> None:
+            try:
+                grabber.stop()
+            except Exception as e:
+                self.logger.error(
+                    "Error stopping input %s: %s", getattr(grabber, "cam_id", "?"), e
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=len(grabbers), thread_name_prefix="input-stop"
+        ) as pool:
+            list(pool.map(_stop_one, grabbers))
+
+    def _run_periodic_retention(self) -> None:
+        """Run media / event-log retention when ``total_cycles`` hits their intervals."""
+        r = self._retention
+        n = self.total_cycles
+        if (
+            self.media_store
+            and r.media_every_n_cycles > 0
+            and n % r.media_every_n_cycles == 0
+        ):
+            self._maybe_run_media_retention()
+        if r.event_log_every_n_cycles > 0 and n % r.event_log_every_n_cycles == 0:
+            self._maybe_run_event_log_retention()
 
     def _maybe_run_media_retention(self) -> None:
         if not self.media_store:
@@ -837,9 +949,9 @@ class Orchestrator:
         try:
             stats = self.memory_manager.apply_media_retention(
                 self.media_store.root,
-                retention_days=self._media_retention_days,
-                max_total_mb=self._media_max_total_mb,
-                max_files_per_camera=self._media_max_files_per_camera,
+                retention_days=self._retention.media_retention_days,
+                max_total_mb=self._retention.media_max_total_mb,
+                max_files_per_camera=self._retention.media_max_files_per_camera,
             )
             total = sum(stats.values())
             if total > 0:
@@ -854,12 +966,11 @@ class Orchestrator:
 
     def _maybe_run_event_log_retention(self) -> None:
         """Prune old ``events`` and ``metrics`` rows per recipe ``event_log.retention_days``."""
-        if self._event_log_retention_days <= 0:
+        days = self._retention.event_log_retention_days
+        if days <= 0:
             return
         try:
-            deleted = self.memory_manager.cleanup_old_data(
-                days=self._event_log_retention_days
-            )
+            deleted = self.memory_manager.cleanup_old_data(days=days)
             if deleted > 0:
                 self.logger.info("Event log retention: removed %s old DB rows", deleted)
         except Exception as e:
@@ -868,8 +979,8 @@ class Orchestrator:
 
 def main():
     import argparse
-    import yaml
-    import sys
+
+    from .yaml_io import safe_load as yaml_safe_load
 
     argv = sys.argv[1:]
     if argv and argv[0] == "discover":
@@ -886,10 +997,7 @@ def main():
         return
 
     # Setup basic logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    _setup_logging()
     from .logging_redact import install_telegram_token_log_redaction
 
     install_telegram_token_log_redaction()
@@ -966,13 +1074,11 @@ def main():
                 )
                 sys.exit(1)
 
-    logger.info(f"Starting orchestrator with recipe: {resolved_recipe_path}")
+    logger.info("Starting orchestrator with recipe: %s", resolved_recipe_path)
 
     try:
-        logger.info("Loading recipe file...")
         with open(resolved_recipe_path, "r", encoding="utf-8") as f:
-            recipe = yaml.safe_load(f)
-        logger.info("Recipe loaded successfully")
+            recipe = yaml_safe_load(f)
     except Exception as e:
         logger.error(
             f"Failed to load recipe from {resolved_recipe_path}: {e}", exc_info=True
@@ -982,11 +1088,16 @@ def main():
         )
         sys.exit(1)
 
-    logger.info("Creating orchestrator instance...")
-    orchestrator = Orchestrator(recipe)
-    logger.info("Orchestrator instance created")
+    try:
+        log_file = _attach_file_logging(recipe or {})
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("File logging disabled: %s", e)
+        log_file = None
+    if log_file is not None:
+        install_telegram_token_log_redaction()
+        logger.info("Logging to file: %s", log_file)
 
-    logger.info("Building components...")
+    orchestrator = Orchestrator(recipe)
     orchestrator.build()
     logger.info("Components built, starting main loop...")
 
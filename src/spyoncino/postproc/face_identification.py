@@ -52,6 +52,11 @@ def _person_alarm_indices(det_frame: Dict[str, Any]) -> List[int]:
     return out
 
 
+def _box_areas(boxes: np.ndarray) -> np.ndarray:
+    """Areas of ``(N, 4)`` xyxy boxes in one NumPy pass (negative extents clamp to 0)."""
+    return np.clip((boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1]), 0.0, None)
+
+
 def score_frame_for_champion(det_frame: Dict[str, Any], policy: str) -> Optional[float]:
     """
     Score one detection frame for champion selection among person-alarmed boxes only.
@@ -64,16 +69,17 @@ def score_frame_for_champion(det_frame: Dict[str, Any], policy: str) -> Optional
     confs = det_frame.get("confidences")
     if boxes is None or confs is None:
         return None
+    boxes_arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    confs_arr = np.asarray(confs, dtype=np.float64).ravel()
+    sel = np.asarray(idxs, dtype=np.intp)
+    sel = sel[sel < len(boxes_arr)]
     max_conf = 0.0
     max_area = 0.0
-    for k in idxs:
-        if k >= len(boxes):
-            continue
-        x1, y1, x2, y2 = (float(t) for t in boxes[k])
-        area = max(0.0, (x2 - x1) * (y2 - y1))
-        c = float(confs[k]) if k < len(confs) else 0.0
-        max_conf = max(max_conf, c)
-        max_area = max(max_area, area)
+    if sel.size:
+        max_area = max(0.0, float(_box_areas(boxes_arr[sel]).max()))
+        csel = sel[sel < len(confs_arr)]
+        if csel.size:
+            max_conf = max(0.0, float(confs_arr[csel].max()))
     pol = (policy or "combined").strip().lower()
     if pol == "confidence":
         return max_conf
@@ -116,19 +122,13 @@ def _largest_person_crop_bgr(
     boxes = det_frame.get("boxes")
     if boxes is None or len(boxes) == 0:
         return None
-    best_i = None
-    best_area = -1.0
-    for k in idxs:
-        if k >= len(boxes):
-            continue
-        x1, y1, x2, y2 = (float(t) for t in boxes[k])
-        area = max(0.0, (x2 - x1) * (y2 - y1))
-        if area > best_area:
-            best_area = area
-            best_i = k
-    if best_i is None:
+    boxes_arr = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    sel = np.asarray(idxs, dtype=np.intp)
+    sel = sel[sel < len(boxes_arr)]
+    if not sel.size:
         return None
-    x1, y1, x2, y2 = (float(t) for t in boxes[best_i])
+    # argmax keeps the first of equal areas, matching the old strict ``>`` scan.
+    x1, y1, x2, y2 = boxes_arr[sel[int(_box_areas(boxes_arr[sel]).argmax())]].tolist()
     h, w = frame.shape[:2]
     bw = max(1.0, x2 - x1)
     bh = max(1.0, y2 - y1)
@@ -442,9 +442,9 @@ class FaceIdentification:
                         crop_bgr = cv2.cvtColor(crop, cv2.COLOR_RGB2BGR)
                 if crop_bgr is None and bbox_face is not None:
                     x1, y1, x2, y2 = (int(max(0, t)) for t in bbox_face)
-                    crop_bgr = frame[y1:y2, x1:x2].copy()
+                    crop_bgr = frame[y1:y2, x1:x2]
                 if crop_bgr is None or crop_bgr.size == 0:
-                    crop_bgr = frame.copy()
+                    crop_bgr = frame
 
                 fd, tmp_name = tempfile.mkstemp(prefix="sp_face_", suffix=".jpg")
                 os.close(fd)
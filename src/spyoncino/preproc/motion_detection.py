@@ -1,25 +1,122 @@
+import logging
+from functools import lru_cache
+
 import numpy as np
 import cv2
-from typing import List
+from typing import Any, List, NamedTuple
+
+_log = logging.getLogger(__name__)
+
+_COLOR_NORMAL = (110, 210, 120)
+_COLOR_ALARMED = (68, 92, 255)
+_PANEL_BG = (22, 36, 30)
+_TEXT_COLOR = (248, 250, 248)
+_FONT = cv2.FONT_HERSHEY_DUPLEX
+# Mask-cleanup kernels, built once instead of on every overlay.
+_OPEN_CLOSE_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+_DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+
+
+class _OverlayGeometry(NamedTuple):
+    font_scale: float
+    thickness: int
+    pad_x: int
+    pad_y: int
+    px1: int
+    py1: int
+
+
+@lru_cache(maxsize=8)
+def _overlay_geometry(h: int, w: int) -> _OverlayGeometry:
+    """Resolution-derived overlay sizes; camera resolution is stable, so cache per (h, w)."""
+    scale = min(w / 1920.0, h / 1080.0)
+    return _OverlayGeometry(
+        font_scale=max(0.42, 0.52 * scale),
+        thickness=max(1, int(round(scale))),
+        pad_x=max(10, int(12 * scale)),
+        pad_y=max(6, int(8 * scale)),
+        px1=int(10 * scale),
+        py1=int(8 * scale),
+    )
+
+
+def _opencv_cuda_available() -> bool:
+    """True when this OpenCV build has the CUDA modules and sees at least one device."""
+    try:
+        return (
+            hasattr(cv2, "cuda")
+            and hasattr(cv2.cuda, "createBackgroundSubtractorMOG2")
+            and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        )
+    except cv2.error:
+        return False
+
+
+class _CudaSubtractor:
+    """MOG2 on the GPU with a reusable upload buffer; ``apply`` returns a host mask."""
+
+    def __init__(self) -> None:
+        self._sub = cv2.cuda.createBackgroundSubtractorMOG2(detectShadows=True)
+        self._stream = cv2.cuda.Stream()
+        self._frame = cv2.cuda.GpuMat()
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        self._frame.upload(frame, self._stream)
+        mask = self._sub.apply(self._frame, -1.0, self._stream)
+        out = mask.download(self._stream)
+        self._stream.waitForCompletion()
+        return out
 
 
 class MotionDetection:
-    def __init__(self, threshold: int = 10):
+    def __init__(
+        self, threshold: int = 10, downscale: float = 1.0, use_cuda: bool = False
+    ):
+        """
+        Args:
+            threshold: Percent of changed pixels that counts as motion (0-100).
+            downscale: Factor in (0, 1] applied to frames before background subtraction;
+                e.g. 0.5 runs MOG2 and the pixel count on 4x fewer pixels. Overlays are
+                still drawn at full frame size.
+            use_cuda: Run MOG2 on the GPU (needs an OpenCV build with CUDA); falls back
+                to the CPU subtractor with a warning otherwise.
+        """
         self.state = {}
         self.threshold = threshold
+        self.downscale = min(1.0, max(0.05, float(downscale or 1.0)))
+        self.use_cuda = bool(use_cuda) and _opencv_cuda_available()
+        if use_cuda and not self.use_cuda:
+            _log.warning("use_cuda: true ignored — OpenCV was built without CUDA")
 
     def _calculate_motion_percent(self, fg_mask: np.ndarray):
         motion_pixels = cv2.countNonZero(fg_mask)
-        total_pixels = fg_mask.shape[0] * fg_mask.shape[1]
-        return int((motion_pixels / total_pixels) * 100), fg_mask
+        return int(motion_pixels * 100 / fg_mask.size), fg_mask
+
+    def _prepare(self, frame: np.ndarray) -> np.ndarray:
+        if self.downscale >= 1.0:
+            return frame
+        return cv2.resize(
+            frame,
+            None,
+            fx=self.downscale,
+            fy=self.downscale,
+            interpolation=cv2.INTER_AREA,
+        )
+
+    def _new_subtractor(self) -> Any:
+        if self.use_cuda:
+            try:
+                return _CudaSubtractor()
+            except cv2.error as e:
+                _log.warning("CUDA MOG2 unavailable (%s); using CPU", e)
+                self.use_cuda = False
+        return cv2.createBackgroundSubtractorMOG2(detectShadows=True)
 
     def peak(self, camera_id: str, frame: np.ndarray):
         if camera_id not in self.state:
-            self.state[camera_id] = cv2.createBackgroundSubtractorMOG2(
-                detectShadows=True
-            )
+            self.state[camera_id] = self._new_subtractor()
 
-        fg_mask = self.state[camera_id].apply(frame)
+        fg_mask = self.state[camera_id].apply(self._prepare(frame))
         motion_percent, fg_mask = self._calculate_motion_percent(fg_mask)
         return motion_percent > self.threshold, motion_percent, fg_mask
 
@@ -41,12 +138,9 @@ class MotionDetection:
 
     def _smooth_mask(self, fg_mask: np.ndarray) -> np.ndarray:
         """Reduce speckle while keeping moving regions readable."""
-        k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        m = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, k)
-        m = cv2.morphologyEx(m, cv2.MORPH_CLOSE, k)
-        k2 = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-        m = cv2.dilate(m, k2, iterations=1)
-        return m
+        m = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, _OPEN_CLOSE_KERNEL)
+        m = cv2.morphologyEx(m, cv2.MORPH_CLOSE, _OPEN_CLOSE_KERNEL)
+        return cv2.dilate(m, _DILATE_KERNEL, iterations=1)
 
     def _create_overlay(
         self,
@@ -57,44 +151,35 @@ class MotionDetection:
     ) -> np.ndarray:
         h, w = frame.shape[:2]
         overlay = np.zeros((h, w, 3), dtype=np.uint8)
-
-        scale = min(w / 1920.0, h / 1080.0)
-        font_scale = max(0.42, 0.52 * scale)
-
-        color_normal = (110, 210, 120)
-        color_alarmed = (68, 92, 255)
-        mask_color = color_alarmed if motion_percent >= threshold else color_normal
+        g = _overlay_geometry(h, w)
+        mask_color = _COLOR_ALARMED if motion_percent >= threshold else _COLOR_NORMAL
 
         cleaned = self._smooth_mask(fg_mask)
-        fg_mask_3ch = cv2.cvtColor(cleaned, cv2.COLOR_GRAY2BGR)
-        colored_mask = np.where(fg_mask_3ch > 0, mask_color, (0, 0, 0))
-        overlay = np.maximum(overlay, colored_mask.astype(np.uint8))
+        if cleaned.shape[:2] != (h, w):
+            cleaned = cv2.resize(cleaned, (w, h), interpolation=cv2.INTER_NEAREST)
+        overlay[cleaned > 0] = mask_color
 
         text = f"Motion {int(motion_percent)}%  (threshold {int(threshold)}%)"
-        font = cv2.FONT_HERSHEY_DUPLEX
-        thickness = max(1, int(round(scale)))
-        (tw, th), baseline = cv2.getTextSize(text, font, font_scale, thickness)
-        pad_x = max(10, int(12 * scale))
-        pad_y = max(6, int(8 * scale))
-        px1 = int(10 * scale)
-        py1 = int(8 * scale)
-        px2 = min(w - 1, px1 + tw + pad_x * 2)
-        py2 = min(h - 1, py1 + th + pad_y * 2)
-        bg = (22, 36, 30)
-        cv2.rectangle(overlay, (px1, py1), (px2, py2), bg, -1, lineType=cv2.LINE_AA)
+        (tw, th), baseline = cv2.getTextSize(text, _FONT, g.font_scale, g.thickness)
+        px1, py1 = g.px1, g.py1
+        px2 = min(w - 1, px1 + tw + g.pad_x * 2)
+        py2 = min(h - 1, py1 + th + g.pad_y * 2)
+        cv2.rectangle(
+            overlay, (px1, py1), (px2, py2), _PANEL_BG, -1, lineType=cv2.LINE_AA
+        )
         cv2.rectangle(
             overlay, (px1, py1), (px2, py2), mask_color, 1, lineType=cv2.LINE_AA
         )
-        tx = px1 + pad_x
-        ty = py1 + th + pad_y - max(0, baseline // 2)
+        tx = px1 + g.pad_x
+        ty = py1 + th + g.pad_y - max(0, baseline // 2)
         cv2.putText(
             overlay,
             text,
             (tx, ty),
-            font,
-            font_scale,
-            (248, 250, 248),
-            thickness,
+            _FONT,
+            g.font_scale,
+            _TEXT_COLOR,
+            g.thickness,
             lineType=cv2.LINE_AA,
         )
 
@@ -29,6 +29,7 @@ from .shared_theme_css import SHARED_DASHBOARD_THEME_CSS
 
 _logger = logging.getLogger(__name__)
 _SENT = object()
+_PACKAGE_DIR = Path(__file__).resolve().parent
 
 
 def _next_event(it: Iterator[dict[str, object]]) -> object:
@@ -39,11 +40,11 @@ def _next_event(it: Iterator[dict[str, object]]) -> object:
 
 
 def _template_path() -> Path:
-    return Path(__file__).resolve().parent / "templates" / "recipe_builder.html"
+    return _PACKAGE_DIR / "templates" / "recipe_builder.html"
 
 
 def _brand_static_dir() -> Optional[Path]:
-    bundled = Path(__file__).resolve().parent / "static"
+    bundled = _PACKAGE_DIR / "static"
     if (bundled / "logo.ico").is_file():
         return bundled
     return None
@@ -39,24 +39,57 @@ RESTART_REQUIRED_CONFIG_KEYS = {
 
 # Keys surfaced by /api/config for UI/Telegram parity: include every tunable even if unset
 # in SQLite and omitted from the current recipe (effective value may be null).
-_DISPLAY_TUNABLE_CONFIG_KEYS: tuple[str, ...] = (
-    "patrol_time",
-    "notification_rate_limit",
-    "notify_on_preproc",
-    "notify_on_detection",
-    "max_file_size_mb",
-    "media.retention_days",
-    "media.max_total_mb",
-    "media.max_files_per_camera",
-    "media.retention_every_n_cycles",
-    "event_log.retention_days",
-    "event_log.retention_every_n_cycles",
+_DISPLAY_TUNABLE_CONFIG_KEYS = frozenset(
+    {
+        "patrol_time",
+        "notification_rate_limit",
+        "notify_on_preproc",
+        "notify_on_detection",
+        "max_file_size_mb",
+        "media.retention_days",
+        "media.max_total_mb",
+        "media.max_files_per_camera",
+        "media.retention_every_n_cycles",
+        "event_log.retention_days",
+        "event_log.retention_every_n_cycles",
+    }
+)
+
+# Integer tunables validated as ``>= 0`` by ``_normalize_config_value``.
+_NON_NEGATIVE_INT_CONFIG_KEYS = frozenset(
+    {
+        "media.retention_days",
+        "media.max_files_per_camera",
+        "media.retention_every_n_cycles",
+        "event_log.retention_days",
+        "event_log.retention_every_n_cycles",
+    }
 )
 
 # Removed from API/UI; face alerts are handled by the face pipeline. SQLite row may still
 # exist until reset — omit from listings and reject writes.
 DEPRECATED_CONFIG_KEYS = frozenset({"notify_on_face"})
 
+# Recipe sections flattened into dot-notated tunables by ``_recipe_tunable_config``.
+_RECIPE_TUNABLE_SECTIONS: Dict[str, tuple[str, ...]] = {
+    "media": (
+        "retention_days",
+        "max_total_mb",
+        "max_files_per_camera",
+        "retention_every_n_cycles",
+    ),
+    "event_log": ("retention_days", "retention_every_n_cycles"),
+}
+
+# Telegram interface ``params.config`` keys surfaced without a prefix.
+_TELEGRAM_TUNABLE_KEYS: tuple[str, ...] = (
+    "notification_rate_limit",
+    "outbound_strategy",
+    "notify_on_preproc",
+    "notify_on_detection",
+    "max_file_size_mb",
+)
+
 
 def _service_to_dict(s: ServiceStatus) -> Dict[str, Any]:
     return {
@@ -260,25 +293,20 @@ class SpyoncinoRuntime:
         Keys are intentionally dot-notated to match the existing `/api/config/{key}` API.
         """
         recipe = self._orch.recipe or {}
-        out: Dict[str, Any] = {}
-        out["patrol_time"] = recipe.get("patrol_time")
-
-        media = recipe.get("media")
-        if isinstance(media, dict):
-            for key in (
-                "retention_days",
-                "max_total_mb",
-                "max_files_per_camera",
-                "retention_every_n_cycles",
-            ):
-                if key in media:
-                    out[f"media.{key}"] = media.get(key)
-
-        event_log = recipe.get("event_log")
-        if isinstance(event_log, dict):
-            for key in ("retention_days", "retention_every_n_cycles"):
-                if key in event_log:
-                    out[f"event_log.{key}"] = event_log.get(key)
+        sections = {
+            name: section
+            for name in _RECIPE_TUNABLE_SECTIONS
+            if isinstance(section := recipe.get(name), dict)
+        }
+        out: Dict[str, Any] = {
+            "patrol_time": recipe.get("patrol_time"),
+            **{
+                f"{name}.{key}": section[key]
+                for name, section in sections.items()
+                for key in _RECIPE_TUNABLE_SECTIONS[name]
+                if key in section
+            },
+        }
 
         interfaces = recipe.get("interfaces")
         if isinstance(interfaces, list):
@@ -302,30 +330,25 @@ class SpyoncinoRuntime:
                 cfg = params.get("config")
                 if not isinstance(cfg, dict):
                     continue
-                for key in (
-                    "notification_rate_limit",
-                    "outbound_strategy",
-                    "notify_on_preproc",
-                    "notify_on_detection",
-                    "max_file_size_mb",
-                ):
-                    if key in cfg:
-                        out[key] = cfg.get(key)
+                out.update({k: cfg[k] for k in _TELEGRAM_TUNABLE_KEYS if k in cfg})
                 break
         return out
 
     def get_all_config(self) -> Dict[str, Any]:
         """
-        Single source of truth per key: always resolve with get_config() so recipe vs SQLite
-        merge cannot disagree (e.g. stale null in a partial merge).
+        Single source of truth per key: every key resolves through ``_effective_config`` (as
+        ``get_config`` does) so recipe vs SQLite merge cannot disagree (e.g. stale null in a
+        partial merge). Recipe and SQLite are each read once for the whole listing.
         """
         with self._orch._control_lock:
             recipe = self._recipe_tunable_config()
             db = self.memory_manager.get_all_config()
             keys = (
-                set(recipe.keys()) | set(db.keys()) | set(_DISPLAY_TUNABLE_CONFIG_KEYS)
+                recipe.keys() | db.keys() | _DISPLAY_TUNABLE_CONFIG_KEYS
             ) - DEPRECATED_CONFIG_KEYS
-            return {k: self.get_config(k) for k in sorted(keys)}
+            return {
+                k: self._effective_config(db.get(k), recipe, k) for k in sorted(keys)
+            }
 
     def get_config_traits(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -335,7 +358,7 @@ class SpyoncinoRuntime:
             keys = (
                 set(self._recipe_tunable_config().keys())
                 | set(self.memory_manager.get_all_config().keys())
-                | set(_DISPLAY_TUNABLE_CONFIG_KEYS)
+                | _DISPLAY_TUNABLE_CONFIG_KEYS
             ) - DEPRECATED_CONFIG_KEYS
         out: Dict[str, Dict[str, Any]] = {}
         for key in sorted(keys):
@@ -346,12 +369,18 @@ class SpyoncinoRuntime:
             }
         return out
 
+    @staticmethod
+    def _effective_config(db_value: Any, recipe: Dict[str, Any], key: str) -> Any:
+        """SQLite value unless null, else the recipe tunable (``get_config`` / ``get_all_config``)."""
+        if db_value is not None:
+            return db_value
+        return recipe.get(key)
+
     def get_config(self, key: str) -> Any:
         with self._orch._control_lock:
-            value = self.memory_manager.get_config(key)
-            if value is not None:
-                return value
-            return self._recipe_tunable_config().get(key)
+            return self._effective_config(
+                self.memory_manager.get_config(key), self._recipe_tunable_config(), key
+            )
 
     @staticmethod
     def _strip_wrapping_quotes(raw: str) -> str:
@@ -383,13 +412,7 @@ class SpyoncinoRuntime:
             if i < 1:
                 raise ValueError("notification_rate_limit must be >= 1")
             return i
-        if key in (
-            "media.retention_days",
-            "media.max_files_per_camera",
-            "media.retention_every_n_cycles",
-            "event_log.retention_days",
-            "event_log.retention_every_n_cycles",
-        ):
+        if key in _NON_NEGATIVE_INT_CONFIG_KEYS:
             try:
                 i = int(value)
             except (TypeError, ValueError):
@@ -0,0 +1,22 @@
+"""
+YAML loading for recipe and secrets files.
+
+Uses PyYAML's libyaml-backed ``CSafeLoader`` when the wheel ships it (same safe subset as
+:func:`yaml.safe_load`, parsed in C); falls back to the pure-Python ``SafeLoader``.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    _SafeLoader: Any = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _SafeLoader = yaml.SafeLoader
+
+
+def safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """Drop-in for :func:`yaml.safe_load` using the fastest available safe loader."""
+    return yaml.load(stream, Loader=_SafeLoader)  # nosec B506 - safe loader only
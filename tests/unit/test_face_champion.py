@@ -3,6 +3,7 @@
 import numpy as np
 
 from spyoncino.postproc.face_identification import (
+    _largest_person_crop_bgr,
     pick_champion_frame_index,
     score_frame_for_champion,
 )
@@ -50,3 +51,30 @@ def test_pick_champion_area_policy():
     b = _frame(0.1, 90000.0)
     b["frame_index"] = 3
     assert pick_champion_frame_index([a, b], "area") == 3
+
+
+def test_score_frame_uses_only_alarmed_person_boxes():
+    det = {
+        "frame_index": 0,
+        "boxes": np.array(
+            [[0, 0, 10, 10], [0, 0, 100, 100], [0, 0, 20, 20]], dtype=np.float32
+        ),
+        "confidences": np.array([0.4, 0.99, 0.7], dtype=np.float32),
+        "labels": ["person", "car", "person"],
+        "is_alarmed": [True, True, True],
+    }
+    assert score_frame_for_champion(det, "area") == 400.0
+    assert score_frame_for_champion(det, "confidence") == np.float32(0.7)
+
+
+def test_largest_person_crop_picks_biggest_alarmed_person():
+    frame = np.zeros((200, 200, 3), dtype=np.uint8)
+    det = {
+        "boxes": np.array(
+            [[0, 0, 30, 30], [0, 0, 190, 190], [50, 50, 150, 150]], dtype=np.float32
+        ),
+        "labels": ["person", "car", "person"],
+        "is_alarmed": [True, True, True],
+    }
+    crop = _largest_person_crop_bgr(frame, det, margin=0.0)
+    assert crop is not None and crop.shape[:2] == (100, 100)
@@ -0,0 +1,67 @@
+"""Recipe ``logging.file``: rotating handler behind a flushing memory buffer."""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from spyoncino import orchestrator as orch
+
+
+@pytest.fixture
+def file_logging(tmp_path):
+    log_path = tmp_path / "logs" / "spyoncino.log"
+    recipe = {"logging": {"file": str(log_path), "max_mb": 2, "backup_count": 3}}
+    assert orch._attach_file_logging(recipe) == log_path.resolve()
+    logger = logging.getLogger("spyoncino.test_file_logging")
+    logger.setLevel(logging.INFO)
+    yield log_path, logger
+    handler = orch._log_buffer
+    target = handler.target
+    logging.getLogger().removeHandler(handler)
+    handler.close()
+    target.close()
+    orch._log_buffer = None
+
+
+def _text(path):
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def test_attaches_rotating_file_handler_once(file_logging):
+    log_path, _ = file_logging
+    handler = orch._log_buffer
+    assert handler in logging.getLogger().handlers
+    target = handler.target
+    assert isinstance(target, logging.handlers.RotatingFileHandler)
+    assert target.baseFilename == str(log_path.resolve())
+    assert target.maxBytes == 2 * 1024 * 1024
+    assert target.backupCount == 3
+    assert orch._attach_file_logging({"logging": {"file": str(log_path)}}) is None
+
+
+def test_info_is_buffered_until_warning(file_logging):
+    log_path, logger = file_logging
+    logger.info("quiet cycle")
+    assert "quiet cycle" not in _text(log_path)
+    logger.warning("camera lost")
+    text = _text(log_path)
+    assert "quiet cycle" in text and "camera lost" in text
+
+
+def test_stale_records_are_flushed(file_logging):
+    log_path, logger = file_logging
+    logger.info("first")
+    orch._flush_file_logging(stale_only=True)
+    assert "first" not in _text(log_path)
+
+    orch._log_buffer.buffer[0].created -= orch._LOG_FLUSH_INTERVAL_S
+    orch._flush_file_logging(stale_only=True)
+    assert "first" in _text(log_path)
+
+    # A record emitted after the interval flushes on its own, without a patrol tick.
+    logger.info("second")
+    orch._log_buffer.buffer[0].created -= orch._LOG_FLUSH_INTERVAL_S
+    logger.info("third")
+    text = _text(log_path)
+    assert "second" in text and "third" in text
@@ -0,0 +1,27 @@
+"""Importing the orchestrator must not pull in heavy optional stacks."""
+
+import subprocess
+import sys
+
+_HEAVY = (
+    "yaml",
+    "torch",
+    "cv2",
+    "PIL",
+    "ultralytics",
+    "telegram",
+    "fastapi",
+    "deepface",
+)
+
+
+def test_orchestrator_import_is_lazy():
+    # Fresh interpreter: other tests in this session import these modules directly.
+    code = (
+        "import sys, spyoncino.orchestrator, spyoncino.interface; "
+        f"print(','.join(m for m in {_HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
@@ -0,0 +1,16 @@
+"""MediaStore path allocation."""
+
+import shutil
+
+from spyoncino.media_store import MediaStore
+
+
+def test_new_artifact_path_recreates_removed_directories(tmp_path):
+    store = MediaStore(tmp_path / "media")
+    first = store.new_artifact_path("cam 1", "detection", "jpeg")
+    assert first.parent.is_dir() and first.suffix == ".jpg"
+
+    shutil.rmtree(store.root)
+    second = store.new_artifact_path("cam 1", "detection", "jpeg")
+    assert second.parent.is_dir()
+    second.write_bytes(b"x")
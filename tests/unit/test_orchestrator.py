@@ -0,0 +1,67 @@
+"""Orchestrator control paths that do not need cameras or models."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from spyoncino import orchestrator as orch
+from spyoncino.interface.memory_manager import MemoryManager
+
+
+class _FakeInput:
+    cam_id = "cam"
+
+    def __init__(self):
+        self.running = True
+
+    def start(self):
+        self.running = True
+
+    def stop(self):
+        self.running = False
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    mm = MemoryManager(db_path=str(tmp_path / "spyoncino.db"))
+    return orch.Orchestrator({"data_root": str(tmp_path)}, memory_manager=mm)
+
+
+def test_failed_self_restart_resumes_inputs_and_clears_schedule(
+    orchestrator, monkeypatch
+):
+    def _fail_execv(*_args):
+        raise OSError("exec format error")
+
+    monkeypatch.setattr(orch.os, "execv", _fail_execv)
+    cam = _FakeInput()
+    orchestrator.inputs = [cam]
+    orchestrator.schedule_restart_if_needed("test")
+    orchestrator._restart_scheduled_at = datetime.now(timezone.utc) - timedelta(
+        seconds=1
+    )
+
+    orchestrator._maybe_execute_scheduled_restart()
+
+    assert cam.running
+    assert orchestrator.get_restart_schedule_status()["scheduled"] is False
+
+
+def test_service_status_time_fields_refresh_every_update(orchestrator):
+    cam = _FakeInput()
+    cam.connected = True
+    orchestrator.inputs = [cam]
+    orchestrator.running = True
+    mm = orchestrator.memory_manager
+
+    orchestrator._update_service_status()
+    first = mm.get_service_status("orchestrator")
+    # Nothing but time changes between the two cycles.
+    orchestrator.start_time -= timedelta(seconds=60)
+    orchestrator._update_service_status()
+    second = mm.get_service_status("orchestrator")
+
+    assert second.uptime_seconds >= first.uptime_seconds + 60
+    assert second.last_check >= first.last_check
+    cam_status = mm.get_service_status("input_cam")
+    assert cam_status.is_running and cam_status.last_error is None
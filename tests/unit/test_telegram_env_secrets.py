@@ -0,0 +1,29 @@
+"""Environment-variable overrides for Telegram secrets."""
+
+from spyoncino.interface.telegram_bot import (
+    _env_secret_snapshot,
+    _secrets_with_env_overrides,
+)
+
+
+def test_env_overrides_file_values_without_mutating_input():
+    file_secrets = {"telegram": {"token": "from-file", "chat_id": None}}
+    env = {"TELEGRAM_BOT_TOKEN": "from-env", "TELEGRAM_CHAT_ID": "-100123"}
+    out = _secrets_with_env_overrides(file_secrets, env)
+    assert out["telegram"] == {"token": "from-env", "chat_id": -100123}
+    assert file_secrets["telegram"]["token"] == "from-file"
+
+
+def test_env_creates_missing_sections_and_skips_invalid_values():
+    env = {
+        "SECURITY_SETUP_PASSWORD": "pw",
+        "TELEGRAM_CHAT_ID": "not-a-number",
+        "TELEGRAM_BOT_TOKEN": "",
+    }
+    out = _secrets_with_env_overrides({}, env)
+    assert out == {"authentication": {"setup_password": "pw"}}
+
+
+def test_env_snapshot_keeps_only_mapped_non_empty_vars():
+    env = {"TELEGRAM_BOT_TOKEN": "t", "TELEGRAM_CHAT_ID": "", "PATH": "/usr/bin"}
+    assert _env_secret_snapshot(env) == {"TELEGRAM_BOT_TOKEN": "t"}
@@ -0,0 +1,20 @@
+"""YAML loader helper matches yaml.safe_load."""
+
+import io
+
+import pytest
+import yaml
+
+from spyoncino.yaml_io import safe_load
+
+
+def test_safe_load_matches_stdlib_safe_load():
+    text = (
+        "patrol_time: 1.5\ninputs:\n  - name: cam\n    params: {fps: 10}\nflag: yes\n"
+    )
+    assert safe_load(io.StringIO(text)) == yaml.safe_load(text)
+
+
+def test_safe_load_rejects_python_tags():
+    with pytest.raises(yaml.YAMLError):
+        safe_load("!!python/object/apply:os.system ['true']")